@@ -1,12 +1,101 @@
 """Base class for all Slack components"""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
+import ssl
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from slack_bolt import App  # pylint: disable=import-error
+from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import (
+    ConnectionErrorRetryHandler,
+    RateLimitErrorRetryHandler,
+)
+from solace_ai_connector.common.log import log
 from solace_ai_connector.components.component_base import ComponentBase
 
+# Keep connections to the feedback endpoint alive between posts. Only
+# connection errors are retried; the POST is not idempotent, so a failure
+# after the request was sent could otherwise record the feedback twice.
+_feedback_session = requests.Session()
+_feedback_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2),
+)
+_feedback_session.mount("https://", _feedback_adapter)
+_feedback_session.mount("http://", _feedback_adapter)
+
+# One SSL context for all Web API calls so that the CA certificates are not
+# reloaded for every new connection
+_slack_ssl_context = ssl.create_default_context()
+
+# Read-only Web API methods whose responses are safe to reuse for a while
+CACHED_API_METHODS = ("users_info", "conversations_info", "users_list")
+
+
+class ApiResponseCache:
+    """A small thread-safe cache of Web API responses that expire after ttl seconds"""
+
+    def __init__(self, ttl=600, maxsize=4096):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self.entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key, response):
+        with self.lock:
+            # Re-insert so that the dict stays ordered by expiry time
+            self.entries.pop(key, None)
+            while len(self.entries) >= self.maxsize:
+                del self.entries[next(iter(self.entries))]
+            self.entries[key] = (time.monotonic() + self.ttl, response)
+
+
+class CachingWebClient:
+    """Wraps a Slack WebClient so that calls to the read-only methods in
+    cached_methods are served from an ApiResponseCache. All other attributes,
+    including the write methods, are passed straight through to the client."""
+
+    def __init__(self, client, cache, cached_methods=CACHED_API_METHODS):
+        self.client = client
+        self.cache = cache
+        self.cached_methods = frozenset(cached_methods)
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if name in self.cached_methods:
+            return functools.partial(self._cached_call, name, attr)
+        return attr
+
+    def _cached_call(self, name, method, **kwargs):
+        try:
+            key = (name, frozenset(kwargs.items()))
+        except TypeError:
+            # Unhashable arguments - just make the call
+            return method(**kwargs)
+        response = self.cache.get(key)
+        if response is None:
+            response = method(**kwargs)
+            self.cache.put(key, response)
+        return response
+
 
 class SlackBase(ComponentBase, ABC):
     _slack_apps = {}
@@ -24,12 +113,25 @@ class SlackBase(ComponentBase, ABC):
 
         if self.share_slack_connection:
             if self.slack_bot_token not in SlackBase._slack_apps:
-                self.app = App(token=self.slack_bot_token)
+                self.app = self.create_app()
                 SlackBase._slack_apps[self.slack_bot_token] = self.app
             else:
                 self.app = SlackBase._slack_apps[self.slack_bot_token]
         else:
-            self.app = App(token=self.slack_bot_token)
+            self.app = self.create_app()
+
+    def create_app(self):
+        client = WebClient(
+            token=self.slack_bot_token,
+            timeout=30,
+            ssl=_slack_ssl_context,
+            retry_handlers=[
+                ConnectionErrorRetryHandler(),
+                # Wait out Slack's Retry-After rather than failing the call
+                RateLimitErrorRetryHandler(max_retry_count=3),
+            ],
+        )
+        return App(client=client)
 
     @abstractmethod
     def invoke(self, message, data):
@@ -40,24 +142,42 @@ class SlackBase(ComponentBase, ABC):
 
     def __repr__(self):
         return self.__str__()
-    
+
     def register_action_handlers(self):
+        # Each action is acknowledged right away and the handling, which makes
+        # several Web API calls and posts the feedback, is done on the action
+        # executor so that the Bolt listener thread is free for the next event
+        self.action_executor = ThreadPoolExecutor(max_workers=10)
+
         @self.app.action("thumbs_up_action")
         def handle_thumbs_up(ack, body, say):
-            self.thumbs_up_down_feedback_handler(ack, body, "thumbs_up")
+            ack()
+            self.run_action_handler(
+                self.thumbs_up_down_feedback_handler, body, "thumbs_up"
+            )
 
         @self.app.action("thumbs_down_action")
         def handle_thumbs_down(ack, body, say):
-            self.thumbs_up_down_feedback_handler(ack, body, "thumbs_down")
+            ack()
+            self.run_action_handler(
+                self.thumbs_up_down_feedback_handler, body, "thumbs_down"
+            )
 
         @self.app.action("feedback_text_reason")
         def handle_feedback_input(ack, body, say):
-            self.feedback_reason_handler(ack, body)
+            ack()
+            self.run_action_handler(self.feedback_reason_handler, body)
 
-    def feedback_reason_handler(self, ack, body):
-        # Acknowledge the action request
-        ack()
-        
+    def run_action_handler(self, handler, *args):
+        def run():
+            try:
+                handler(*args)
+            except Exception as e:
+                log.error("Error handling Slack action: %s", e)
+
+        self.action_executor.submit(run)
+
+    def feedback_reason_handler(self, body):
         # This is a bit of a hack but slack leaves us no choice.
         # The block_id is a stringified JSON object that contains the channel, thread_ts and feedback.
         block_id = body['actions'][0]['block_id']
@@ -101,13 +221,10 @@ class SlackBase(ComponentBase, ABC):
         self._send_feedback_rest_post(body, feedback, feedback_reason, value_object.get("feedback_data", "no feedback provided"))       
 
 
-    def thumbs_up_down_feedback_handler(self, ack, body, feedback):
-        # Acknowledge the action request
-        ack()
-
+    def thumbs_up_down_feedback_handler(self, body, feedback):
         # Check if feedback is enabled and the feedback post URL is set
         if not self.feedback_enabled or not self.feedback_post_url:
-            self.logger.error("Feedback is not enabled or feedback post URL is not set.")
+            log.error("Feedback is not enabled or feedback post URL is not set.")
             return
         
         # Respond to the action
@@ -217,13 +334,16 @@ class SlackBase(ComponentBase, ABC):
             rest_body["feedback_reason"] = feedback_reason
 
         try:
-            requests.post(
+            response = _feedback_session.post(
                 url=self.feedback_post_url,
                 headers=self.feedback_post_headers,
-                data=json.dumps(rest_body)
+                json=rest_body,
+                timeout=(3.0, 10.0),
             )
+            if not response.ok:
+                log.error("Failed to post feedback: HTTP %s", response.status_code)
         except Exception as e:
-            self.logger.error(f"Failed to post feedback: {str(e)}")
+            log.error("Failed to post feedback: %s", e)
 
     @staticmethod
     def _create_feedback_thanks_block(user_id, feedback):
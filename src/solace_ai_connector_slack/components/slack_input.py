@@ -7,7 +7,7 @@ import requests
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from solace_ai_connector.common.message import Message
 from solace_ai_connector.common.log import log
-from .slack_base import SlackBase
+from .slack_base import ApiResponseCache, CachingWebClient, SlackBase
 
 
 info = {
@@ -70,6 +70,16 @@ info = {
             ),
             "required": False,
         },
+        {
+            "name": "api_cache_ttl",
+            "type": "number",
+            "description": (
+                "How long, in seconds, to cache Slack user and channel "
+                "lookups. Default: 600"
+            ),
+            "default": 600,
+            "required": False,
+        },
     ],
     "output_schema": {
         "type": "object",
@@ -145,8 +155,20 @@ info = {
 
 
 class SlackInput(SlackBase):
+    _slack_api_caches = {}
+
     def __init__(self, **kwargs):
         super().__init__(info, **kwargs)
+        # Lookup responses are shared by all inputs with the same bot token and
+        # cache TTL, so each input's api_cache_ttl is honoured
+        cache_key = (self.slack_bot_token, self.get_config("api_cache_ttl", 600))
+        if cache_key not in SlackInput._slack_api_caches:
+            SlackInput._slack_api_caches[cache_key] = ApiResponseCache(
+                ttl=cache_key[1]
+            )
+        self.client = CachingWebClient(
+            self.app.client, SlackInput._slack_api_caches[cache_key]
+        )
         self.slack_receiver_queue = None
         self.slack_receiver = None
         self.init_slack_receiver()
@@ -166,6 +188,7 @@ class SlackInput(SlackBase):
             listen_to_channels=self.get_config("listen_to_channels"),
             send_history_on_join=self.get_config("send_history_on_join"),
             acknowledgement_message=self.get_config("acknowledgement_message"),
+            client=self.client,
         )
         self.slack_receiver.start()
 
@@ -198,9 +221,12 @@ class SlackReceiver(threading.Thread):
         listen_to_channels=False,
         send_history_on_join=False,
         acknowledgement_message=None,
+        client=None,
     ):
         threading.Thread.__init__(self)
         self.app = app
+        # Used for lookups such as users_info that are cached across messages
+        self.client = client or app.client
         self.slack_app_token = slack_app_token
         self.slack_bot_token = slack_bot_token
         self.input_queue = input_queue
@@ -354,7 +380,7 @@ class SlackReceiver(threading.Thread):
         return base64_string
 
     def get_user_email(self, user_id):
-        response = self.app.client.users_info(user=user_id)
+        response = self.client.users_info(user=user_id)
         return response["user"]["profile"].get("email", user_id)
 
     def process_text_for_mentions(self, text):
@@ -366,7 +392,7 @@ class SlackReceiver(threading.Thread):
                 mention = mention[1:]
             if mention.startswith("U"):
                 user_id = mention.split(">")[0]
-                response = self.app.client.users_info(user=user_id)
+                response = self.client.users_info(user=user_id)
                 profile = response.get("user", {}).get("profile")
                 if profile:
                     replacement = profile.get(
@@ -380,7 +406,7 @@ class SlackReceiver(threading.Thread):
         return text, mention_emails
 
     def get_channel_name(self, channel_id):
-        response = self.app.client.conversations_info(channel=channel_id)
+        response = self.client.conversations_info(channel=channel_id)
         return response["channel"].get("name")
 
     def get_channel_history(self, channel_id, team_id):
@@ -1,13 +1,18 @@
 import base64
+import io
 import re
 import json
-from datetime import datetime
-
-from prettytable import PrettyTable
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from solace_ai_connector.common.log import log
 from .slack_base import SlackBase
 
+_LINK_RE = re.compile(r"\[(.*?)\]\((http.*?)\)")
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+
 
 info = {
     "class_name": "SlackOutput",
@@ -50,7 +55,29 @@ info = {
             "name": "feedback_post_headers",
             "type": "object",
             "description": "Headers to send with feedback post.",
-        }
+        },
+        {
+            "name": "streaming_update_rate",
+            "type": "number",
+            "description": (
+                "The maximum sustained rate, in updates per second, at which "
+                "this component updates streamed responses in each channel. "
+                "Intermediate updates are skipped when the limit is reached. "
+                "Default: 1"
+            ),
+            "default": 1,
+            "required": False,
+        },
+        {
+            "name": "streaming_update_burst",
+            "type": "number",
+            "description": (
+                "The number of streaming updates that may be sent to a channel "
+                "in a burst before streaming_update_rate applies. Default: 5"
+            ),
+            "default": 5,
+            "required": False,
+        },
     ],
     "input_schema": {
         "type": "object",
@@ -128,11 +155,108 @@ info = {
 }
 
 
+class TokenBucket:
+    """Rate limiter that allows bursts of up to capacity calls and refills
+    at rate calls per second"""
+
+    def __init__(self, rate=1.0, capacity=5):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_acquire(self):
+        """Take a token if one is available and return 0. Otherwise return
+        the number of seconds until the next token will be available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+
+class ChannelRateLimiter:
+    """A TokenBucket per channel. Buckets that have been idle long enough to
+    refill completely are dropped, since a new bucket would behave the same."""
+
+    def __init__(self, rate=1.0, capacity=5):
+        self.rate = rate
+        self.capacity = capacity
+        self.idle_time = capacity / rate
+        # Ordered from least to most recently used
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def try_acquire(self, channel):
+        with self.lock:
+            bucket = self.buckets.pop(channel, None)
+            if bucket is None:
+                bucket = TokenBucket(rate=self.rate, capacity=self.capacity)
+            self.buckets[channel] = bucket
+            delay = bucket.try_acquire()
+
+            now = time.monotonic()
+            while self.buckets:
+                oldest = next(iter(self.buckets.values()))
+                if now - oldest.last_refill < self.idle_time:
+                    break
+                del self.buckets[next(iter(self.buckets))]
+            return delay
+
+
+class PendingUpdates:
+    """The latest unsent chat_update for each (channel, ts), in arrival order.
+    Putting an update never blocks; a newer update for the same message
+    replaces the older one."""
+
+    def __init__(self):
+        self.updates = {}
+        self.stopped = False
+        self.condition = threading.Condition()
+
+    def put(self, channel, ts, text, blocks):
+        with self.condition:
+            self.updates[(channel, ts)] = (text, blocks)
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+
+    def take_all(self):
+        with self.condition:
+            updates = [(*key, *value) for key, value in self.updates.items()]
+            self.updates.clear()
+            return updates
+
+
 class SlackOutput(SlackBase):
     def __init__(self, **kwargs):
         super().__init__(info, **kwargs)
         self.fix_formatting = self.get_config("correct_markdown_formatting", True)
         self.streaming_state = {}
+        # (create_time, uuid) in insertion order, used to age out old state
+        self.streaming_state_order = deque()
+        self.update_senders = []
+        self.update_sender_threads = []
+        update_rate = self.get_config("streaming_update_rate", 1)
+        update_burst = self.get_config("streaming_update_burst", 5)
+        if not update_rate or update_rate <= 0:
+            raise ValueError("streaming_update_rate must be greater than 0")
+        if not update_burst or update_burst < 1:
+            raise ValueError("streaming_update_burst must be at least 1")
+        self.update_rate_limiter = ChannelRateLimiter(
+            rate=update_rate, capacity=update_burst
+        )
+        self.start_update_senders()
+        self.upload_executor = ThreadPoolExecutor(max_workers=4)
         self.register_action_handlers()
 
     def invoke(self, message, data):
@@ -182,18 +306,20 @@ class SlackOutput(SlackBase):
 
     def send_message(self, message):
         try:
-            channel = message.get_data("previous:channel")
-            messages = message.get_data("previous:text")
-            streaming = message.get_data("previous:streaming")
-            files = message.get_data("previous:files") or []
-            reply_to = (message.get_user_properties() or {}).get("reply_to_thread", message.get_data("previous:thread_ts"))
-            ack_msg_ts = message.get_data("previous:ack_msg_ts")
-            first_chunk = message.get_data("previous:first_chunk")
-            last_chunk = message.get_data("previous:last_chunk")
-            uuid = message.get_data("previous:uuid")
-            status_update = message.get_data("previous:status_update")
-            response_complete = message.get_data("previous:response_complete")
-            feedback_data = message.get_data("previous:feedback_data") or {}
+            # Fetch the output of invoke once rather than looking up each field
+            previous = message.get_data("previous") or {}
+            channel = previous.get("channel")
+            messages = previous.get("text")
+            streaming = previous.get("streaming")
+            files = previous.get("files") or []
+            reply_to = (message.get_user_properties() or {}).get("reply_to_thread", previous.get("thread_ts"))
+            ack_msg_ts = previous.get("ack_msg_ts")
+            first_chunk = previous.get("first_chunk")
+            last_chunk = previous.get("last_chunk")
+            uuid = previous.get("uuid")
+            status_update = previous.get("status_update")
+            response_complete = previous.get("response_complete")
+            feedback_data = previous.get("feedback_data") or {}
 
             if not isinstance(messages, list):
                 if messages is not None:
@@ -240,26 +366,22 @@ class SlackOutput(SlackBase):
 
                         if not ts:
                             ts = ack_msg_ts
-                        try:
-                            self.app.client.chat_update(
-                                channel=channel, ts=ts, text="test", blocks=blocks
-                            )
-                        except Exception:
-                            pass
+                        if ts:
+                            self.queue_update(uuid, channel, ts, text, blocks)
+                        # The message no longer shows the last streamed text
+                        streaming_state.pop("last_text", None)
                     elif ts:
-                        try:
-                            self.app.client.chat_update(
-                                channel=channel, ts=ts, text=text
-                            )
-                        except Exception:
-                            # It is normal to possibly get an update after the final
-                            # message has already arrived and deleted the ack message
-                            pass
+                        # Streamed chunks often repeat the text that was already sent
+                        if text == streaming_state.get("last_text"):
+                            continue
+                        streaming_state["last_text"] = text
+                        self.queue_update(uuid, channel, ts, text)
                     else:
                         response = self.app.client.chat_postMessage(
                             channel=channel, text=text, thread_ts=reply_to
                         )
                         streaming_state["ts"] = response["ts"]
+                        streaming_state["last_text"] = text
 
                 else:
                     # Not streaming
@@ -270,14 +392,8 @@ class SlackOutput(SlackBase):
                             channel=channel, text=text, thread_ts=reply_to
                         )
 
-            for file in files:
-                file_content = base64.b64decode(file["content"])
-                self.app.client.files_upload_v2(
-                    channel=channel,
-                    file=file_content,
-                    thread_ts=reply_to,
-                    filename=file["name"],
-                )
+            if files:
+                self.upload_files(files, channel, reply_to)
 
             if streaming and response_complete and self.feedback_enabled:
                 blocks = self.create_feedback_blocks(feedback_data, channel, reply_to)
@@ -291,29 +407,154 @@ class SlackOutput(SlackBase):
 
         super().send_message(message)
 
+    def upload_files(self, files, channel, thread_ts):
+        def upload_file(file):
+            # Pop the base64 content so it can be freed once decoded instead of
+            # staying alive next to the decoded copy for the whole upload
+            file_content = io.BytesIO(base64.b64decode(file.pop("content")))
+            self.app.client.files_upload_v2(
+                channel=channel,
+                file=file_content,
+                thread_ts=thread_ts,
+                filename=file["name"],
+            )
+
+        # The uploads are independent, so run them concurrently and then wait
+        # for all of them so that anything sent afterwards lands below the files
+        futures = [self.upload_executor.submit(upload_file, file) for file in files]
+        for future in futures:
+            future.result()
+
+    def start_update_senders(self, num_senders=4):
+        # Streaming updates are sent from background threads so that the component
+        # is not held up by a Slack round trip for every chunk. All updates for a
+        # uuid go to the same sender so that they are applied in order.
+        for _ in range(num_senders):
+            pending = PendingUpdates()
+            sender = threading.Thread(
+                target=self._update_sender_loop, args=(pending,), daemon=True
+            )
+            sender.start()
+            self.update_senders.append(pending)
+            self.update_sender_threads.append(sender)
+
+    def stop_component(self):
+        for pending in self.update_senders:
+            pending.stop()
+        for sender in self.update_sender_threads:
+            sender.join()
+
+        # Send the newest text of any stream that was still waiting on the
+        # rate limit, so that the final version of each message is not lost
+        for pending in self.update_senders:
+            for channel, ts, text, blocks in pending.take_all():
+                self._send_update(channel, ts, text, blocks)
+
+        self.upload_executor.shutdown(wait=True)
+
+    def queue_update(self, uuid, channel, ts, text, blocks=None):
+        pending = self.update_senders[hash(uuid) % len(self.update_senders)]
+        pending.put(channel, ts, text, blocks)
+
+    def _update_sender_loop(self, pending):
+        wait = None
+        while not pending.stopped:
+            try:
+                wait = self._send_pending_updates(pending, wait)
+            except Exception as e:
+                log.error("Error sending slack update: %s", e)
+                wait = None
+
+    def _send_pending_updates(self, pending, wait):
+        # Block until there is an update, or until a rate limited channel can
+        # send again. Updates that arrive in the meantime replace the pending
+        # update for the same message so only the newest text gets sent.
+        ready = []
+        with pending.condition:
+            if pending.stopped:
+                return None
+            if not pending.updates:
+                pending.condition.wait()
+            elif wait:
+                pending.condition.wait(timeout=wait)
+            if pending.stopped:
+                return None
+
+            wait = None
+            for channel, ts in list(pending.updates):
+                delay = self.update_rate_limiter.try_acquire(channel)
+                if delay:
+                    wait = delay if wait is None else min(wait, delay)
+                    continue
+                ready.append((channel, ts, *pending.updates.pop((channel, ts))))
+
+        for channel, ts, text, blocks in ready:
+            self._send_update(channel, ts, text, blocks)
+        return wait
+
+    def _send_update(self, channel, ts, text, blocks):
+        update_args = {"channel": channel, "ts": ts, "text": text}
+        if blocks:
+            update_args["blocks"] = blocks
+        try:
+            self.app.client.chat_update(**update_args)
+        except Exception:
+            # It is normal to possibly get an update after the final
+            # message has already arrived and deleted the ack message
+            pass
+
     def fix_markdown(self, message):
+        # Most streamed chunks contain none of these constructs, so check for the
+        # marker characters before running the substitutions
+
         # Fix links - the LLM is very stubborn about giving markdown links
         # Find [text](http...) and replace with <http...|text>
-        message = re.sub(r"\[(.*?)\]\((http.*?)\)", r"<\2|\1>", message)
+        if "[" in message:
+            message = _LINK_RE.sub(r"<\2|\1>", message)
         # Remove the language specifier from code blocks
-        message = re.sub(r"```[a-z]+\n", "```", message)
+        if "```" in message:
+            message = self.strip_code_block_languages(message)
         # Fix bold
-        message = re.sub(r"\*\*(.*?)\*\*", r"*\1*", message)
+        if "**" in message:
+            message = _BOLD_RE.sub(r"*\1*", message)
 
         # Reformat a table to be Slack compatible
-        message = self.convert_markdown_tables(message)
+        if "|" in message:
+            message = self.convert_markdown_tables(message)
 
         return message
 
+    @staticmethod
+    def strip_code_block_languages(message):
+        # Turn ```lang\n into ``` where lang is lowercase letters. The kept pieces
+        # are joined once at the end rather than rebuilding the message per fence.
+        parts = []
+        start = 0
+        i = message.find("```")
+        while i != -1:
+            j = i + 3
+            while j < len(message) and "a" <= message[j] <= "z":
+                j += 1
+            if j > i + 3 and j < len(message) and message[j] == "\n":
+                parts.append(message[start : i + 3])
+                start = j + 1
+                i = message.find("```", start)
+            else:
+                i = message.find("```", i + 1)
+        parts.append(message[start:])
+        return "".join(parts)
+
     def get_streaming_state(self, uuid):
         return self.streaming_state.get(uuid)
 
     def add_streaming_state(self, uuid):
+        now = time.monotonic()
         state = {
-            "create_time": datetime.now(),
+            "create_time": now,
         }
         self.streaming_state[uuid] = state
-        self.age_out_streaming_state()
+        self.streaming_state_order.append((now, uuid))
+        self.age_out_streaming_state(now=now)
         return state
 
     def delete_streaming_state(self, uuid):
@@ -322,35 +563,78 @@ class SlackOutput(SlackBase):
         except KeyError:
             pass
 
-    def age_out_streaming_state(self, age=60):
-        # Note that we can later optimize this by using an array of streaming_state that
-        # is ordered by create_time and then we can just remove the first element until
-        # we find one that is not expired.
-        now = datetime.now()
-        for uuid, state in list(self.streaming_state.items()):
-            if (now - state["create_time"]).total_seconds() > age:
+    def age_out_streaming_state(self, age=60, now=None):
+        if now is None:
+            now = time.monotonic()
+        order = self.streaming_state_order
+        while order and now - order[0][0] > age:
+            create_time, uuid = order.popleft()
+            # The uuid may have been deleted or re-added since this entry was queued
+            state = self.streaming_state.get(uuid)
+            if state and state["create_time"] == create_time:
                 del self.streaming_state[uuid]
 
     def convert_markdown_tables(self, message):
-        def markdown_to_fixed_width(match):
-            table_str = match.group(0)
-            rows = [
-                line.strip().split("|")
-                for line in table_str.split("\n")
-                if line.strip()
-            ]
-            headers = [cell.strip() for cell in rows[0] if cell.strip()]
+        # A single pass over the lines, collecting runs of complete "|...|" lines.
+        # A run that has a header, a separator and at least one row is a table.
+        parts = []
+        table_lines = []
+        for line in message.splitlines(keepends=True):
+            stripped = line.strip()
+            if (
+                len(stripped) > 1
+                and stripped[0] == "|"
+                and stripped[-1] == "|"
+                and line[-1] in "\r\n"
+            ):
+                table_lines.append((stripped, line))
+                continue
+            self._flush_table_lines(table_lines, parts)
+            parts.append(line)
+        self._flush_table_lines(table_lines, parts)
+        return "".join(parts)
+
+    @staticmethod
+    def _flush_table_lines(table_lines, parts):
+        # table_lines holds (stripped, original) pairs. The table starts at the
+        # line above the first separator that has at least one row after it;
+        # any pipe lines before that are left as they are.
+        for i in range(1, len(table_lines) - 1):
+            if not table_lines[i][0].strip("|-: "):
+                parts.extend(t[1] for t in table_lines[: i - 1])
+                parts.append(
+                    SlackOutput.markdown_to_fixed_width(
+                        [t[0] for t in table_lines[i - 1 :]]
+                    )
+                )
+                break
+        else:
+            parts.extend(t[1] for t in table_lines)
+        table_lines.clear()
 
-            pt = PrettyTable()
-            pt.field_names = headers
+    @staticmethod
+    def markdown_to_fixed_width(lines):
+        # Split each row once, dropping the outer pipes
+        rows = [[cell.strip() for cell in line[1:-1].split("|")] for line in lines]
+        headers = rows[0]
+        num_columns = len(headers)
+        body = [(row + [""] * num_columns)[:num_columns] for row in rows[2:]]
+
+        widths = [
+            max([len(header)] + [len(row[i]) for row in body])
+            for i, header in enumerate(headers)
+        ]
 
-            for row in rows[2:]:
-                pt.add_row([cell.strip() for cell in row if cell.strip()])
+        def format_row(row):
+            return " | ".join(
+                cell.ljust(width) for cell, width in zip(row, widths)
+            ).rstrip()
 
-            return f"\n```\n{pt.get_string()}\n```\n"
+        table_lines = [format_row(headers), "-+-".join("-" * w for w in widths)]
+        table_lines.extend(format_row(row) for row in body)
+        table = "\n".join(table_lines)
 
-        pattern = r"\|.*\|[\n\r]+\|[-:| ]+\|[\n\r]+((?:\|.*\|[\n\r]+)+)"
-        return re.sub(pattern, markdown_to_fixed_width, message)
+        return f"\n```\n{table}\n```\n"
 
     @staticmethod
     def create_feedback_blocks(value_object, channel, thread_ts):
@@ -0,0 +1,13 @@
+import pytest
+
+
+class FakeClock:
+    def __init__(self, monkeypatch):
+        self.now = 1000.0
+        monkeypatch.setattr("time.monotonic", lambda: self.now)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time.monotonic with a clock that only moves when told to"""
+    return FakeClock(monkeypatch)
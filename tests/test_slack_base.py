@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from solace_ai_connector_slack.components import slack_base
+from solace_ai_connector_slack.components.slack_base import (
+    ApiResponseCache,
+    CachingWebClient,
+)
+from solace_ai_connector_slack.components.slack_output import SlackOutput
+
+
+class FakeWebClient:
+    token = "xoxb-test"
+
+    def __init__(self):
+        self.calls = []
+
+    def users_info(self, **kwargs):
+        self.calls.append(("users_info", kwargs))
+        return {"user": {"id": kwargs.get("user")}, "call": len(self.calls)}
+
+    def chat_postMessage(self, **kwargs):
+        self.calls.append(("chat_postMessage", kwargs))
+        return {"ok": True}
+
+
+def test_cache_entries_expire_after_ttl(clock):
+    cache = ApiResponseCache(ttl=10)
+    cache.put("key", "value")
+
+    clock.now += 10
+    assert cache.get("key") == "value"
+    clock.now += 0.1
+    assert cache.get("key") is None
+    assert "key" not in cache.entries
+
+
+def test_cache_evicts_oldest_entry_when_full():
+    cache = ApiResponseCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # Re-putting "a" makes "b" the oldest entry
+    cache.put("a", 3)
+    cache.put("c", 4)
+    assert cache.get("b") is None
+    assert cache.get("a") == 3
+    assert cache.get("c") == 4
+
+
+def test_caching_client_caches_read_only_methods(clock):
+    web_client = FakeWebClient()
+    client = CachingWebClient(web_client, ApiResponseCache(ttl=600))
+
+    first = client.users_info(user="U1")
+    assert client.users_info(user="U1") is first
+    client.users_info(user="U2")
+    assert len(web_client.calls) == 2
+
+    clock.now += 601
+    assert client.users_info(user="U1") is not first
+    assert len(web_client.calls) == 3
+
+
+def test_caching_client_passes_other_attributes_through():
+    web_client = FakeWebClient()
+    client = CachingWebClient(web_client, ApiResponseCache())
+
+    client.chat_postMessage(channel="C1", text="hi")
+    client.chat_postMessage(channel="C1", text="hi")
+    assert len(web_client.calls) == 2
+    assert client.token == "xoxb-test"
+    with pytest.raises(AttributeError):
+        client.not_a_method  # pylint: disable=pointless-statement
+
+
+def test_caching_client_skips_cache_for_unhashable_arguments():
+    web_client = FakeWebClient()
+    client = CachingWebClient(
+        web_client, ApiResponseCache(), cached_methods=["users_info"]
+    )
+
+    client.users_info(user=["U1"])
+    client.users_info(user=["U1"])
+    assert len(web_client.calls) == 2
+
+
+@pytest.fixture
+def logged_errors(monkeypatch):
+    errors = []
+    monkeypatch.setattr(
+        slack_base.log, "error", lambda msg, *args: errors.append(msg % args)
+    )
+    return errors
+
+
+def make_component(**attrs):
+    # SlackBase is abstract, so use SlackOutput without its Slack setup
+    component = SlackOutput.__new__(SlackOutput)
+    component.__dict__.update(attrs)
+    return component
+
+
+def test_action_handler_errors_are_logged(logged_errors):
+    component = make_component(action_executor=ThreadPoolExecutor(max_workers=1))
+
+    def handler(body):
+        raise RuntimeError("boom")
+
+    component.run_action_handler(handler, {})
+    component.action_executor.shutdown(wait=True)
+    assert logged_errors == ["Error handling Slack action: boom"]
+
+
+def test_feedback_handler_logs_when_feedback_disabled(logged_errors):
+    component = make_component(feedback_enabled=False, feedback_post_url=None)
+    component.thumbs_up_down_feedback_handler({}, "thumbs_up")
+    assert logged_errors == [
+        "Feedback is not enabled or feedback post URL is not set."
+    ]
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+
+def post_feedback(monkeypatch, response):
+    posts = []
+
+    def fake_post(**kwargs):
+        posts.append(kwargs)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(slack_base._feedback_session, "post", fake_post)
+    component = make_component(
+        feedback_post_url="https://feedback.example.com",
+        feedback_post_headers={"Authorization": "Bearer token"},
+    )
+    body = {"user": {"id": "U1"}, "channel": {"id": "C1"}}
+    component._send_feedback_rest_post(body, "thumbs_down", "too long", {"a": 1})
+    return posts
+
+
+def test_feedback_post_sends_json_body(monkeypatch, logged_errors):
+    posts = post_feedback(monkeypatch, FakeResponse(200))
+    assert posts[0]["url"] == "https://feedback.example.com"
+    assert posts[0]["json"] == {
+        "user": {"id": "U1"},
+        "feedback": "thumbs_down",
+        "interface": "slack",
+        "interface_data": {"channel": {"id": "C1"}},
+        "data": {"a": 1},
+        "feedback_reason": "too long",
+    }
+    assert not logged_errors
+
+
+def test_feedback_post_logs_error_response(monkeypatch, logged_errors):
+    post_feedback(monkeypatch, FakeResponse(500))
+    assert logged_errors == ["Failed to post feedback: HTTP 500"]
+
+
+def test_feedback_post_logs_request_failure(monkeypatch, logged_errors):
+    post_feedback(monkeypatch, ConnectionError("refused"))
+    assert logged_errors == ["Failed to post feedback: refused"]
@@ -0,0 +1,27 @@
+from solace_ai_connector_slack.components.slack_base import SlackBase
+from solace_ai_connector_slack.components.slack_input import SlackInput
+
+
+def make_input(monkeypatch, **config):
+    def base_init(self, _module_info, **_kwargs):
+        self.slack_bot_token = "xoxb-test"
+        self.app = type("FakeApp", (), {"client": object()})()
+
+    monkeypatch.setattr(SlackBase, "__init__", base_init)
+    monkeypatch.setattr(
+        SlackInput, "get_config", lambda self, key, default=None: config.get(key, default)
+    )
+    monkeypatch.setattr(SlackInput, "init_slack_receiver", lambda self: None)
+    return SlackInput()
+
+
+def test_inputs_share_api_cache_per_token_and_ttl(monkeypatch):
+    monkeypatch.setattr(SlackInput, "_slack_api_caches", {})
+    first = make_input(monkeypatch)
+    second = make_input(monkeypatch, api_cache_ttl=600)
+    short = make_input(monkeypatch, api_cache_ttl=30)
+
+    assert first.client.cache is second.client.cache
+    assert short.client.cache is not first.client.cache
+    assert first.client.cache.ttl == 600
+    assert short.client.cache.ttl == 30
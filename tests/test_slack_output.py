@@ -0,0 +1,334 @@
+import random
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from solace_ai_connector.common.message import Message
+
+from solace_ai_connector_slack.components.slack_output import (
+    ChannelRateLimiter,
+    PendingUpdates,
+    SlackOutput,
+    TokenBucket,
+)
+
+
+def fix_markdown(message):
+    # fix_markdown doesn't use any instance state, so skip the component setup
+    return SlackOutput.fix_markdown(SlackOutput.__new__(SlackOutput), message)
+
+
+def test_fix_markdown_bold():
+    assert fix_markdown("some **bold** text") == "some *bold* text"
+
+
+def test_fix_markdown_leaves_unpaired_double_asterisks():
+    assert fix_markdown("def f(*args, **kwargs):") == "def f(*args, **kwargs):"
+    assert fix_markdown("return 2**10") == "return 2**10"
+    assert fix_markdown("a ** b") == "a ** b"
+
+
+def test_strip_code_block_languages():
+    message = "```python\nprint(1)\n```\ntext\n```bash\nls\n```"
+    assert (
+        SlackOutput.strip_code_block_languages(message)
+        == "```print(1)\n```\ntext\n```ls\n```"
+    )
+
+
+def test_strip_code_block_languages_matches_regex():
+    rng = random.Random(1)
+    for _ in range(20000):
+        message = "".join(rng.choice("`ab\nX") for _ in range(rng.randint(0, 16)))
+        assert SlackOutput.strip_code_block_languages(message) == re.sub(
+            r"```[a-z]+\n", "```", message
+        )
+
+
+class FakeClient:
+    def __init__(self):
+        self.updates = []
+
+    def chat_update(self, **kwargs):
+        self.updates.append(kwargs)
+
+
+def make_update_sender(rate=1, capacity=5):
+    output = SlackOutput.__new__(SlackOutput)
+    output.app = type("FakeApp", (), {"client": FakeClient()})()
+    output.update_rate_limiter = ChannelRateLimiter(rate=rate, capacity=capacity)
+    output.update_senders = []
+    output.update_sender_threads = []
+    output.upload_executor = ThreadPoolExecutor(max_workers=1)
+    return output
+
+
+def test_pending_updates_keep_only_latest_per_message():
+    pending = PendingUpdates()
+    for i in range(2000):
+        pending.put("C1", "1.0", f"text {i}", None)
+    pending.put("C1", "2.0", "other", None)
+    assert pending.updates == {
+        ("C1", "1.0"): ("text 1999", None),
+        ("C1", "2.0"): ("other", None),
+    }
+
+
+def test_send_pending_updates_sends_latest_text():
+    output = make_update_sender()
+    pending = PendingUpdates()
+    pending.put("C1", "1.0", "first", None)
+    pending.put("C1", "1.0", "second", [{"type": "context"}])
+    pending.put("C2", "2.0", "plain", None)
+
+    assert output._send_pending_updates(pending, None) is None
+    assert output.app.client.updates == [
+        {"channel": "C1", "ts": "1.0", "text": "second", "blocks": [{"type": "context"}]},
+        {"channel": "C2", "ts": "2.0", "text": "plain"},
+    ]
+    assert not pending.updates
+
+
+def test_send_pending_updates_holds_rate_limited_updates():
+    output = make_update_sender(rate=1, capacity=1)
+    pending = PendingUpdates()
+    pending.put("C1", "1.0", "first", None)
+    output._send_pending_updates(pending, None)
+
+    pending.put("C1", "1.0", "second", None)
+    wait = output._send_pending_updates(pending, None)
+    assert 0 < wait <= 1
+    assert pending.updates == {("C1", "1.0"): ("second", None)}
+    assert [u["text"] for u in output.app.client.updates] == ["first"]
+
+
+def test_stop_component_sends_rate_limited_updates():
+    output = make_update_sender(rate=0.001, capacity=1)
+    output.start_update_senders(num_senders=2)
+
+    output.queue_update("uuid-1", "C1", "1.0", "first")
+    deadline = time.monotonic() + 5
+    while not output.app.client.updates and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # This one is held back by the rate limit until the component stops
+    output.queue_update("uuid-1", "C1", "1.0", "final")
+
+    output.stop_component()
+    assert [u["text"] for u in output.app.client.updates] == ["first", "final"]
+    assert not any(sender.is_alive() for sender in output.update_sender_threads)
+    with pytest.raises(RuntimeError):
+        output.upload_executor.submit(print)
+
+
+def test_token_bucket_allows_burst_then_refills(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    assert [bucket.try_acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.try_acquire() == 0.5
+
+    clock.now += 0.5
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0.5
+
+    # Refilling never goes past the capacity
+    clock.now += 100
+    assert [bucket.try_acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.try_acquire() > 0
+
+
+def test_channel_rate_limiter_limits_each_channel(clock):
+    limiter = ChannelRateLimiter(rate=1, capacity=1)
+    assert limiter.try_acquire("C1") == 0
+    assert limiter.try_acquire("C1") == 1
+    assert limiter.try_acquire("C2") == 0
+
+
+def test_channel_rate_limiter_drops_idle_buckets(clock):
+    limiter = ChannelRateLimiter(rate=1, capacity=2)
+    limiter.try_acquire("C1")
+    clock.now += 1
+    limiter.try_acquire("C2")
+    assert list(limiter.buckets) == ["C1", "C2"]
+
+    # C1 has been idle for capacity / rate seconds, C2 has not
+    clock.now += 1
+    limiter.try_acquire("C3")
+    assert list(limiter.buckets) == ["C2", "C3"]
+
+
+def convert_markdown_tables(message):
+    return SlackOutput.convert_markdown_tables(
+        SlackOutput.__new__(SlackOutput), message
+    )
+
+
+def test_convert_markdown_tables():
+    message = "Results:\n| Name | Qty |\n|:-----|----:|\n| apple | 2 |\n| kiwi | 10 |\nDone"
+    assert convert_markdown_tables(message) == (
+        "Results:\n"
+        "\n```\n"
+        "Name  | Qty\n"
+        "------+----\n"
+        "apple | 2\n"
+        "kiwi  | 10\n"
+        "```\n"
+        "Done"
+    )
+
+
+def test_convert_markdown_tables_crlf_line_endings():
+    message = "| a | b |\r\n|---|---|\r\n| 1 | 2 |\r\n"
+    assert convert_markdown_tables(message) == "\n```\na | b\n--+--\n1 | 2\n```\n"
+
+
+def test_convert_markdown_tables_final_row_without_newline():
+    # A row is only complete once its newline has arrived, which matters when
+    # the table is still being streamed
+    assert convert_markdown_tables("| a |\n|---|\n| 1 |") == "| a |\n|---|\n| 1 |"
+    assert (
+        convert_markdown_tables("| a |\n|---|\n| 1 |\n| 2 |")
+        == "\n```\na\n-\n1\n```\n| 2 |"
+    )
+
+
+def test_convert_markdown_tables_needs_separator_and_row():
+    for message in [
+        "| a | b |\n| 1 | 2 |\n| 3 | 4 |\n",
+        "| a | b |\n|---|---|\n",
+        "x | y | z\n",
+    ]:
+        assert convert_markdown_tables(message) == message
+
+
+def test_convert_markdown_tables_pipe_lines_above_header():
+    message = "| note |\n| more |\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+    assert convert_markdown_tables(message) == (
+        "| note |\n| more |\n\n```\na | b\n--+--\n1 | 2\n```\n"
+    )
+
+
+def test_convert_markdown_tables_leaves_surrounding_text():
+    message = "before\n\n| a |\n|---|\n| 1 |\n\nafter | with | pipes\n"
+    assert convert_markdown_tables(message) == (
+        "before\n\n\n```\na\n-\n1\n```\n\nafter | with | pipes\n"
+    )
+
+
+def test_convert_markdown_tables_ragged_rows():
+    message = "| a | b |\n|---|---|\n| 1 |\n| 1 | 2 | 3 |\n"
+    assert convert_markdown_tables(message) == (
+        "\n```\na | b\n--+--\n1 |\n1 | 2\n```\n"
+    )
+
+
+def test_markdown_to_fixed_width_column_widths():
+    lines = ["| Item | Description |", "|---|---|", "| a | short |", "| longer item |  |"]
+    assert SlackOutput.markdown_to_fixed_width(lines) == (
+        "\n```\n"
+        "Item        | Description\n"
+        "------------+------------\n"
+        "a           | short\n"
+        "longer item |\n"
+        "```\n"
+    )
+
+
+def make_streaming_output():
+    output = SlackOutput.__new__(SlackOutput)
+    output.streaming_state = {}
+    output.streaming_state_order = deque()
+    return output
+
+
+def test_age_out_streaming_state(clock):
+    output = make_streaming_output()
+    output.add_streaming_state("u1")
+    clock.now += 30
+    state = output.add_streaming_state("u2")
+
+    clock.now += 31
+    output.age_out_streaming_state()
+    assert output.get_streaming_state("u1") is None
+    assert output.get_streaming_state("u2") is state
+
+
+def test_age_out_keeps_re_added_streaming_state(clock):
+    output = make_streaming_output()
+    output.add_streaming_state("u1")
+    clock.now += 30
+    state = output.add_streaming_state("u1")
+
+    # The stale entry for the first add expires, but must not remove the new state
+    clock.now += 31
+    output.age_out_streaming_state()
+    assert output.get_streaming_state("u1") is state
+
+    clock.now += 30
+    output.age_out_streaming_state()
+    assert output.get_streaming_state("u1") is None
+    assert not output.streaming_state_order
+
+
+class FakePostingClient(FakeClient):
+    def __init__(self):
+        super().__init__()
+        self.posts = []
+
+    def chat_postMessage(self, **kwargs):
+        self.posts.append(kwargs)
+        return {"ts": f"{len(self.posts)}.0"}
+
+
+def make_sending_output():
+    output = make_streaming_output()
+    output.fix_formatting = False
+    output.feedback_enabled = False
+    output.next_component = None
+    output.app = type("FakeApp", (), {"client": FakePostingClient()})()
+    output.queued = []
+    output.queue_update = lambda *args: output.queued.append(args)
+    return output
+
+
+def send_chunk(output, text, **previous):
+    message = Message(payload={})
+    message.set_previous(
+        {
+            "text": text,
+            "uuid": "u1",
+            "channel": "C1",
+            "streaming": True,
+            "ack_msg_ts": "0.5",
+            **previous,
+        }
+    )
+    output.send_message(message)
+
+
+def test_send_message_skips_unchanged_streaming_text():
+    output = make_sending_output()
+    send_chunk(output, "Hello", first_chunk=True)
+    assert [p["text"] for p in output.app.client.posts] == ["Hello"]
+
+    # The text posted with chat_postMessage seeds last_text
+    send_chunk(output, "Hello")
+    assert output.queued == []
+
+    send_chunk(output, "Hello world")
+    send_chunk(output, "Hello world")
+    assert output.queued == [("u1", "C1", "1.0", "Hello world")]
+
+
+def test_send_message_resends_text_after_status_update():
+    output = make_sending_output()
+    send_chunk(output, "Hello", first_chunk=True)
+    send_chunk(output, "Searching", status_update=True)
+    assert output.get_streaming_state("u1").get("last_text") is None
+
+    # The status update replaced the message, so the same text is sent again
+    send_chunk(output, "Hello")
+    assert len(output.queued) == 2
+    assert output.queued[0][:3] == ("u1", "C1", "1.0")
+    assert output.queued[0][4] is not None
+    assert output.queued[1] == ("u1", "C1", "1.0", "Hello")